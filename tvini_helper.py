@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
+import asyncio
 import subprocess
 import threading
+import queue
+import time
 import platform
 import sys
 import os
 import re
 import stat
+import shutil
 import json
 import webbrowser
 import ssl
+import functools
+import socket
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from urllib.request import urlopen, Request
 from urllib.error import URLError
 
@@ -36,7 +44,22 @@ except ImportError:
 VERSION = "2.0.0"
 UPDATE_CHECK_URL = "https://tvini.io/ar/adb_update"
 
+# Set SCRCPY_DEBUG=1 to echo scrcpy's output to the console
+SCRCPY_DEBUG = os.environ.get("SCRCPY_DEBUG") == "1" and hasattr(sys.stdout, "buffer")
+
 POLL_INTERVAL_MS = 2000
+MAX_POLL_INTERVAL_MS = 30000
+FULL_PROBE_INTERVAL_S = 10.0
+PROBE_BACKOFF_FAILURES = 3
+PROBE_BACKOFF_S = 30.0
+PROBE_WORKERS = 8
+PIPE_READ_SIZE = 1 << 16
+MIRROR_STOP_TIMEOUT_S = 0.5
+UI_DRAIN_INTERVAL_MS = 50
+MAX_MIRRORS = 8
+THREAD_PRIORITY_BELOW_NORMAL = -1
+BACKGROUND_NICE = 5
+ADB_SERVER_ADDR = ("127.0.0.1", int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037")))
 SYSTEM = platform.system()
 
 if getattr(sys, 'frozen', False):
@@ -61,6 +84,22 @@ RED = "#FF6B6B"
 YELLOW = "#FFD93D"
 BLUE = "#4DA6FF"
 
+UI_FONT_FAMILY = "Segoe UI" if SYSTEM == "Windows" else "SF Pro Display"
+
+# Shared CTkFont objects, each one allocates and measures a font in Tcl
+_FONTS: dict[tuple, ctk.CTkFont] = {}
+
+def _font(size: int, weight: str = "normal", family: str | None = None) -> ctk.CTkFont:
+    key = (size, weight, family)
+    font = _FONTS.get(key)
+    if font is None:
+        if family:
+            font = ctk.CTkFont(family=family, size=size, weight=weight)
+        else:
+            font = ctk.CTkFont(size=size, weight=weight)
+        _FONTS[key] = font
+    return font
+
 def _parse_version(version_str: str) -> tuple:
     try:
         parts = version_str.strip().split(".")
@@ -68,16 +107,18 @@ def _parse_version(version_str: str) -> tuple:
     except (ValueError, AttributeError):
         return (0, 0, 0)
 
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    # Loading the CA bundle is the expensive part, build the context only once
+    if CERTIFI_AVAILABLE:
+        return ssl.create_default_context(cafile=certifi.where())
+    return ssl.create_default_context()
+
 def _check_for_update() -> dict | None:
     try:
         req = Request(UPDATE_CHECK_URL, headers={"User-Agent": "AndroidMirror"})
 
-        if CERTIFI_AVAILABLE:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-        else:
-            ssl_context = ssl.create_default_context()
-        
-        with urlopen(req, timeout=5, context=ssl_context) as response:
+        with urlopen(req, timeout=5, context=_ssl_context()) as response:
             data = json.loads(response.read().decode("utf-8"))
 
         latest_version = data.get("latest", "0.0.0")
@@ -103,17 +144,17 @@ class UpdateDialog(ctk.CTkToplevel):
         latest = metadata.get("latest", "")
         ctk.CTkLabel(
             self, text="🔄",
-            font=ctk.CTkFont(size=36),
+            font=_font(36),
         ).pack(pady=(20, 10))
         ctk.CTkLabel(
             self, text=note,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=TEXT_PRIMARY,
             wraplength=350,
         ).pack(pady=(0, 5))
         ctk.CTkLabel(
             self, text=f"Current: {VERSION}  →  Latest: {latest}",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=TEXT_SECONDARY,
         ).pack(pady=(0, 15))
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -122,7 +163,7 @@ class UpdateDialog(ctk.CTkToplevel):
             ctk.CTkButton(
                 btn_frame, text="Download Update",
                 fg_color=ACCENT, hover_color=ACCENT_DIM,
-                text_color=BG_DARK, font=ctk.CTkFont(size=13, weight="bold"),
+                text_color=BG_DARK, font=_font(13, "bold"),
                 width=140, height=36,
                 command=lambda: self._open_url(url),
             ).pack(side="left", padx=(0, 10))
@@ -130,7 +171,7 @@ class UpdateDialog(ctk.CTkToplevel):
             btn_frame, text="Later",
             fg_color="transparent", hover_color=BG_CARD_HOVER,
             border_width=1, border_color=BORDER,
-            text_color=TEXT_SECONDARY, font=ctk.CTkFont(size=13),
+            text_color=TEXT_SECONDARY, font=_font(13),
             width=100, height=36,
             command=self.destroy,
         ).pack(side="left")
@@ -144,30 +185,54 @@ class UpdateDialog(ctk.CTkToplevel):
         webbrowser.open(url)
         self.destroy()
 
+@functools.lru_cache(maxsize=1)
 def _creation_flags():
     if SYSTEM == "Windows":
         return subprocess.CREATE_NO_WINDOW
     return 0
 
+# Lower-cased file name -> path for the bundled scrcpy folder
+_TOOL_INDEX: dict[str, str] = {}
+
+def _scan_tools():
+    # One directory read finds both adb.exe and scrcpy.exe
+    index = {}
+    if SYSTEM == "Windows":
+        try:
+            with os.scandir(os.path.join(TOOLS_DIR, "windows", "scrcpy")) as entries:
+                index = {e.name.lower(): e.path for e in entries if e.is_file()}
+        except OSError:
+            pass
+    _TOOL_INDEX.clear()
+    _TOOL_INDEX.update(index)
+
 def _find_bundled_adb() -> str | None:
     if SYSTEM == "Windows":
         # scrcpy Windows zip bundles adb.exe alongside scrcpy.exe
-        path = os.path.join(TOOLS_DIR, "windows", "scrcpy", "adb.exe")
-        if os.path.isfile(path):
-            return path
+        return _TOOL_INDEX.get("adb.exe")
     else:
         print("OS is not Windows")
         return None
-    return None
 
 def _find_bundled_scrcpy() -> str | None:
     if SYSTEM == "Windows":
-        path = os.path.join(TOOLS_DIR, "windows", "scrcpy", "scrcpy.exe")
-        if os.path.isfile(path):
-            return path
+        return _TOOL_INDEX.get("scrcpy.exe")
     else:
         print("OS is not Windows")
         return None
+
+_scan_tools()
+
+@functools.lru_cache(maxsize=1)
+def _find_zadig() -> str | None:
+    if SYSTEM != "Windows":
+        return None
+    path = os.path.join(TOOLS_DIR, "windows", "zadig-2.9.exe")
+    if os.path.isfile(path):
+        return path
+    path = os.path.join(TOOLS_DIR, "windows", "zadig.exe")
+    if os.path.isfile(path):
+        return path
     return None
 
 def _ensure_executable(path: str):
@@ -184,18 +249,169 @@ def _build_env(adb_path: str, scrcpy_path: str) -> dict:
     env["PATH"] = extra_path + os.pathsep + env.get("PATH", "")
     return env
 
-def get_adb_devices(adb_path: str) -> list[dict]:
+def _lower_thread_priority():
+    # Called on background threads so they never preempt the Tk thread
+    try:
+        if SYSTEM == "Windows":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL)
+        elif SYSTEM == "Linux":
+            # Linux applies PRIO_PROCESS with a thread id to that thread only
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), BACKGROUND_NICE)
+    except (OSError, AttributeError):
+        pass
+
+# Shared across polls so probe threads are reused instead of recreated
+_PROBE_POOL = ThreadPoolExecutor(
+    max_workers=PROBE_WORKERS, thread_name_prefix="adb-probe", initializer=_lower_thread_priority,
+)
+
+def _start_adb_server(adb_path: str):
+    try:
+        subprocess.run(
+            [adb_path, "start-server"],
+            capture_output=True, timeout=10,
+            creationflags=_creation_flags(),
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        pass
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = b""
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("adb server closed the connection")
+        buf += chunk
+    return buf
+
+def _adb_request(sock: socket.socket, request: str):
+    # adb server protocol: 4 hex digit length prefix, then OKAY or FAIL + message
+    sock.sendall(f"{len(request):04x}{request}".encode("utf-8"))
+    status = _recv_exact(sock, 4)
+    if status != b"OKAY":
+        length = int(_recv_exact(sock, 4), 16)
+        raise ConnectionError(_recv_exact(sock, length).decode("utf-8", errors="replace"))
+
+def _adb_query(request: str, timeout: float = 5) -> str:
+    with socket.create_connection(ADB_SERVER_ADDR, timeout=timeout) as sock:
+        _adb_request(sock, request)
+        length = int(_recv_exact(sock, 4), 16)
+        return _recv_exact(sock, length).decode("utf-8", errors="replace")
+
+def _adb_shell_oneshot(adb: str, serial: str, command: str, timeout: float = 5) -> str:
+    try:
+        sock = socket.create_connection(ADB_SERVER_ADDR, timeout=timeout)
+    except OSError:
+        # Server not reachable, let the adb client start it
+        r = subprocess.run(
+            [adb, "-s", serial, "shell", command],
+            capture_output=True, timeout=timeout,
+            creationflags=_creation_flags(),
+        )
+        return r.stdout.decode("utf-8", errors="replace")
+
+    with sock:
+        _adb_request(sock, f"host:transport:{serial}")
+        _adb_request(sock, f"shell:{command}")
+        chunks = []
+        while chunk := sock.recv(4096):
+            chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+_SHELL_END = "__END__"
+
+class _AdbShell:
+    # Long-lived sh on the device, fed one command at a time. exec: gives a
+    # raw stream without a pty, so there is no echo or prompt to strip.
+    def __init__(self, serial: str, timeout: float = 5):
+        self.serial = serial
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._sock = socket.create_connection(ADB_SERVER_ADDR, timeout=timeout)
+        try:
+            _adb_request(self._sock, f"host:transport:{serial}")
+            _adb_request(self._sock, "exec:sh")
+        except OSError:
+            self._sock.close()
+            raise
+
+    def run(self, command: str) -> str:
+        marker = f"\n{_SHELL_END}\n".encode("utf-8")
+        with self._lock:
+            self._sock.sendall(f"{command}; echo; echo {_SHELL_END}\n".encode("utf-8"))
+            while (end := self._buf.find(marker)) == -1:
+                chunk = self._sock.recv(4096)
+                if not chunk:
+                    raise ConnectionError("adb shell closed")
+                self._buf += chunk
+            out, self._buf = self._buf[:end], self._buf[end + len(marker):]
+        return out.decode("utf-8", errors="replace")
+
+    def close(self):
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+_ADB_SHELLS: dict[str, _AdbShell] = {}
+
+def _close_adb_shell(serial: str):
+    shell = _ADB_SHELLS.pop(serial, None)
+    if shell is not None:
+        shell.close()
+
+def _adb_shell(adb: str, serial: str, command: str, timeout: float = 5) -> str:
+    shell = _ADB_SHELLS.get(serial)
+    if shell is None:
+        try:
+            shell = _AdbShell(serial, timeout)
+        except OSError:
+            return _adb_shell_oneshot(adb, serial, command, timeout)
+        _ADB_SHELLS[serial] = shell
+    try:
+        return shell.run(command)
+    except OSError:
+        # Stream is out of sync after a timeout or drop, reopen on next call
+        _close_adb_shell(serial)
+        raise
+
+def _adb_devices_output(adb_path: str, long: bool = True) -> str | None:
+    try:
+        return _adb_query("host:devices-l" if long else "host:devices")
+    except OSError:
+        pass
     try:
         result = subprocess.run(
-            [adb_path, "devices", "-l"],
-            capture_output=True, text=True, timeout=5,
+            [adb_path, "devices", "-l"] if long else [adb_path, "devices"],
+            capture_output=True, timeout=5,
             creationflags=_creation_flags(),
         )
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    # Drop the "List of devices attached" header
+    return result.stdout.decode("utf-8", errors="replace").strip().partition("\n")[2]
+
+def get_adb_serials(adb_path: str) -> set[tuple[str, str]] | None:
+    # Cheap listing without per-device metadata, used to detect changes
+    output = _adb_devices_output(adb_path, long=False)
+    if output is None:
+        return None
+    serials = set()
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[1] in ("device", "unauthorized"):
+            serials.add((parts[0], parts[1]))
+    return serials
+
+def get_adb_devices(adb_path: str) -> list[dict]:
+    output = _adb_devices_output(adb_path)
+    if output is None:
         return []
 
     devices = []
-    for line in result.stdout.strip().splitlines()[1:]:
+    for line in output.splitlines():
         line = line.strip()
         if not line or "offline" in line:
             continue
@@ -210,57 +426,127 @@ def get_adb_devices(adb_path: str) -> list[dict]:
         info = {"serial": serial, "status": status}
 
         for part in parts[2:]:
-            if ":" in part:
-                k, v = part.split(":", 1)
+            k, sep, v = part.partition(":")
+            if sep:
                 info[k] = v
 
-        if status == "device":
-            info["model"] = _adb_prop(adb_path, serial, "ro.product.model") or info.get("model", serial)
-            info["manufacturer"] = _adb_prop(adb_path, serial, "ro.product.manufacturer") or ""
-            info["android_version"] = _adb_prop(adb_path, serial, "ro.build.version.release") or ""
-            info["sdk"] = _adb_prop(adb_path, serial, "ro.build.version.sdk") or ""
-            info["resolution"] = _get_resolution(adb_path, serial)
-            info["battery"] = _get_battery(adb_path, serial)
         devices.append(info)
 
+    # Each probe blocks on USB I/O, so run them concurrently across devices
+    online = [d for d in devices if d["status"] == "device"]
+    if online:
+        list(_PROBE_POOL.map(lambda info: _probe_one_device(adb_path, info), online))
+
     return devices
 
-def _adb_prop(adb: str, serial: str, prop: str) -> str:
+def _probe_one_device(adb: str, info: dict) -> dict:
+    probe = _adb_bulk_probe(adb, info["serial"])
+    info["model"] = probe["model"] or info.get("model", info["serial"])
+    info["manufacturer"] = probe["manufacturer"]
+    info["android_version"] = probe["android_version"]
+    info["sdk"] = probe["sdk"]
+    info["resolution"] = probe["resolution"]
+    info["battery"] = probe["battery"]
+    return info
+
+_PROBE_SEP = "__SEP__"
+_STATIC_PROPS = (
+    ("model", "ro.product.model"),
+    ("manufacturer", "ro.product.manufacturer"),
+    ("android_version", "ro.build.version.release"),
+    ("sdk", "ro.build.version.sdk"),
+)
+_STATIC_CMDS = [f"getprop {prop}" for _, prop in _STATIC_PROPS]
+_VOLATILE_CMDS = ["wm size", "dumpsys battery | grep level"]
+_RE_RES = re.compile(r"(\d+x\d+)")
+_RE_BAT = re.compile(r"level:\s*(\d+)")
+# scrcpy install log markers, matched on lower-cased raw bytes
+_RE_INSTALL_LOG = re.compile(
+    rb"(?P<inst>installing|install )|(?P<ok>success)|(?P<bad>failure|failed|error)"
+)
+
+# Build props never change while a device stays connected, keyed by serial
+_PROP_CACHE: dict[str, dict] = {}
+
+# serial -> (last failure monotonic time, consecutive failures)
+_PROBE_FAILURES: dict[str, tuple[float, int]] = {}
+
+def _probe_backed_off(serial: str) -> bool:
+    last_ts, count = _PROBE_FAILURES.get(serial, (0.0, 0))
+    return count > PROBE_BACKOFF_FAILURES and time.monotonic() - last_ts < PROBE_BACKOFF_S
+
+def _record_probe_failure(serial: str):
+    _, count = _PROBE_FAILURES.get(serial, (0.0, 0))
+    _PROBE_FAILURES[serial] = (time.monotonic(), count + 1)
+
+def _adb_bulk_probe(adb: str, serial: str) -> dict:
+    # One adb shell round-trip for all device fields instead of one per field
+    cached = _PROP_CACHE.get(serial)
+    cmds = _VOLATILE_CMDS if cached else _STATIC_CMDS + _VOLATILE_CMDS
+    probe = dict(cached) if cached else {k: "" for k, _ in _STATIC_PROPS}
+    probe["resolution"] = ""
+    probe["battery"] = None
+    if _probe_backed_off(serial):
+        return probe
     try:
-        r = subprocess.run(
-            [adb, "-s", serial, "shell", "getprop", prop],
-            capture_output=True, text=True, timeout=3,
-            creationflags=_creation_flags(),
-        )
-        return r.stdout.strip()
+        stdout = _adb_shell(adb, serial, f"; echo {_PROBE_SEP}; ".join(cmds))
     except Exception:
-        return ""
-
-def _get_resolution(adb: str, serial: str) -> str:
-    try:
-        r = subprocess.run(
-            [adb, "-s", serial, "shell", "wm", "size"],
-            capture_output=True, text=True, timeout=3,
-            creationflags=_creation_flags(),
-        )
-        m = re.search(r"(\d+x\d+)", r.stdout)
-        return m.group(1) if m else ""
-    except Exception:
-        return ""
-
-def _get_battery(adb: str, serial: str) -> int | None:
+        _record_probe_failure(serial)
+        return probe
+
+    chunks = [c.strip() for c in stdout.split(_PROBE_SEP)]
+    if len(chunks) != len(cmds):
+        _record_probe_failure(serial)
+        return probe
+    _PROBE_FAILURES.pop(serial, None)
+
+    if not cached:
+        for (key, _), value in zip(_STATIC_PROPS, chunks):
+            probe[key] = value
+        if probe["model"]:
+            _PROP_CACHE[serial] = {k: probe[k] for k, _ in _STATIC_PROPS}
+        chunks = chunks[len(_STATIC_PROPS):]
+
+    m = _RE_RES.search(chunks[0])
+    probe["resolution"] = m.group(1) if m else ""
+    m = _RE_BAT.search(chunks[1])
+    probe["battery"] = int(m.group(1)) if m else None
+    return probe
+
+def _device_display_name(device: dict) -> str:
+    manufacturer = device.get("manufacturer", "").capitalize()
+    model = device.get("model", device["serial"])
+    return f"{manufacturer} {model}".strip() if manufacturer else model
+
+def _device_subtitle(device: dict) -> str:
+    sub_parts = []
+    if device.get("android_version"):
+        sub_parts.append(f"Android {device['android_version']}")
+    if device.get("resolution"):
+        sub_parts.append(device["resolution"])
+    sub_parts.append(device["serial"])
+    return "  ·  ".join(sub_parts)
+
+def _battery_color(battery: int) -> str:
+    return ACCENT if battery > 30 else (YELLOW if battery > 15 else RED)
+
+_CARD_CHILD_TAG = "DeviceCardChild"
+
+async def _terminate_all(procs: list[asyncio.subprocess.Process]):
+    # Signal every mirror first, then reap them together
+    for proc in procs:
+        try:
+            proc.terminate()
+        except ProcessLookupError:
+            pass
     try:
-        r = subprocess.run(
-            [adb, "-s", serial, "shell", "dumpsys", "battery"],
-            capture_output=True, text=True, timeout=3,
-            creationflags=_creation_flags(),
-        )
-        m = re.search(r"level:\s*(\d+)", r.stdout)
-        return int(m.group(1)) if m else None
-    except Exception:
-        return None
+        await asyncio.wait_for(asyncio.gather(*(p.wait() for p in procs)), MIRROR_STOP_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        pass
 
 class DeviceCard(ctk.CTkFrame):
+    _child_tag_bound = False
+
     def __init__(self, master, device: dict, on_click):
         super().__init__(
             master,
@@ -280,83 +566,102 @@ class DeviceCard(ctk.CTkFrame):
         icon_frame = ctk.CTkFrame(self, fg_color=ACCENT_DIM, corner_radius=10, width=48, height=48)
         icon_frame.grid(row=0, column=0, rowspan=2, padx=(16, 12), pady=16, sticky="ns")
         icon_frame.grid_propagate(False)
-        icon_label = ctk.CTkLabel(icon_frame, text="📱", font=ctk.CTkFont(size=22))
+        icon_label = ctk.CTkLabel(icon_frame, text="📱", font=_font(22))
         icon_label.place(relx=0.5, rely=0.5, anchor="center")
 
-        manufacturer = device.get("manufacturer", "").capitalize()
-        model = device.get("model", device["serial"])
-        display_name = f"{manufacturer} {model}".strip() if manufacturer else model
-
-        name_label = ctk.CTkLabel(
-            self, text=display_name,
-            font=ctk.CTkFont(
-                family="Segoe UI" if SYSTEM == "Windows" else "SF Pro Display",
-                size=15, weight="bold"
-            ),
+        self.name_label = ctk.CTkLabel(
+            self, text=_device_display_name(device),
+            font=_font(15, "bold", UI_FONT_FAMILY),
             text_color=TEXT_PRIMARY, anchor="w",
         )
-        name_label.grid(row=0, column=1, sticky="sw", padx=(0, 16), pady=(16, 0))
-
-        sub_parts = []
-        if device.get("android_version"):
-            sub_parts.append(f"Android {device['android_version']}")
-        if device.get("resolution"):
-            sub_parts.append(device["resolution"])
-        sub_parts.append(device["serial"])
-        sub_text = "  ·  ".join(sub_parts)
-
-        sub_label = ctk.CTkLabel(
-            self, text=sub_text,
-            font=ctk.CTkFont(size=12),
+        self.name_label.grid(row=0, column=1, sticky="sw", padx=(0, 16), pady=(16, 0))
+
+        self.sub_label = ctk.CTkLabel(
+            self, text=_device_subtitle(device),
+            font=_font(12),
             text_color=TEXT_SECONDARY, anchor="w",
         )
-        sub_label.grid(row=1, column=1, sticky="nw", padx=(0, 16), pady=(2, 16))
+        self.sub_label.grid(row=1, column=1, sticky="nw", padx=(0, 16), pady=(2, 16))
 
+        self.bat_label = None
+        self.mirror_label = None
         right_frame = ctk.CTkFrame(self, fg_color="transparent")
         right_frame.grid(row=0, column=2, rowspan=2, padx=(0, 16), pady=16, sticky="e")
 
         if device["status"] == "unauthorized":
             status_label = ctk.CTkLabel(
                 right_frame, text="⚠ Unauthorized",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=_font(12, "bold"),
                 text_color=YELLOW,
             )
             status_label.pack(anchor="e")
             hint = ctk.CTkLabel(
                 right_frame, text="Allow USB debugging",
-                font=ctk.CTkFont(size=10), text_color=TEXT_MUTED,
+                font=_font(10), text_color=TEXT_MUTED,
             )
             hint.pack(anchor="e")
         else:
-            battery = device.get("battery")
-            if battery is not None:
-                bat_color = ACCENT if battery > 30 else (YELLOW if battery > 15 else RED)
-                bat_label = ctk.CTkLabel(
-                    right_frame, text=f"🔋 {battery}%",
-                    font=ctk.CTkFont(size=13, weight="bold"),
-                    text_color=bat_color,
-                )
-                bat_label.pack(anchor="e")
-
-            mirror_label = ctk.CTkLabel(
+            # Always created so update_device can show it once battery is known
+            self.bat_label = ctk.CTkLabel(
+                right_frame, text="",
+                font=_font(13, "bold"),
+            )
+            self.mirror_label = ctk.CTkLabel(
                 right_frame, text="Click to mirror →",
-                font=ctk.CTkFont(size=11), text_color=TEXT_MUTED,
+                font=_font(11), text_color=TEXT_MUTED,
             )
-            mirror_label.pack(anchor="e", pady=(2, 0))
+            self.mirror_label.pack(anchor="e", pady=(2, 0))
+            self._set_battery(device.get("battery"))
 
         self.bind("<Button-1>", self._handle_click)
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
-        for child in self.winfo_children():
-            child.bind("<Button-1>", self._handle_click)
-            self._bind_recursive(child)
+        # Children share one class-level binding instead of three binds each
+        if not DeviceCard._child_tag_bound:
+            self.bind_class(_CARD_CHILD_TAG, "<Button-1>", lambda e: DeviceCard._forward(e, "_handle_click"))
+            self.bind_class(_CARD_CHILD_TAG, "<Enter>", lambda e: DeviceCard._forward(e, "_on_enter"))
+            self.bind_class(_CARD_CHILD_TAG, "<Leave>", lambda e: DeviceCard._forward(e, "_on_leave"))
+            DeviceCard._child_tag_bound = True
+        self._tag_children(self)
+
+    def update_device(self, device: dict):
+        if _device_display_name(device) != _device_display_name(self.device):
+            self.name_label.configure(text=_device_display_name(device))
+        self.update_volatile(device)
+
+    def update_volatile(self, device: dict):
+        # Only the fields re-probed on every poll: resolution and battery
+        old, self.device = self.device, device
+        if _device_subtitle(device) != _device_subtitle(old):
+            self.sub_label.configure(text=_device_subtitle(device))
+        if device.get("battery") != old.get("battery"):
+            self._set_battery(device.get("battery"))
+
+    def _set_battery(self, battery: int | None):
+        if self.bat_label is None:
+            return
+        if battery is None:
+            self.bat_label.pack_forget()
+            return
+        self.bat_label.configure(text=f"🔋 {battery}%", text_color=_battery_color(battery))
+        if not self.bat_label.winfo_manager():
+            self.bat_label.pack(anchor="e", before=self.mirror_label)
 
-    def _bind_recursive(self, widget):
+    def _tag_children(self, widget):
         for child in widget.winfo_children():
-            child.bind("<Button-1>", self._handle_click)
-            child.bind("<Enter>", lambda e: self._on_enter(e))
-            child.bind("<Leave>", lambda e: self._on_leave(e))
-            self._bind_recursive(child)
+            # The card's own canvas already gets self.bind's handlers
+            if child is self._canvas:
+                continue
+            child.bindtags((_CARD_CHILD_TAG,) + child.bindtags())
+            self._tag_children(child)
+
+    @staticmethod
+    def _forward(event, handler: str):
+        widget = event.widget
+        while widget is not None and not isinstance(widget, DeviceCard):
+            widget = getattr(widget, "master", None)
+        if widget is not None:
+            getattr(widget, handler)(event)
 
     def _on_enter(self, event):
         if not self._is_mirroring:
@@ -372,7 +677,8 @@ class DeviceCard(ctk.CTkFrame):
         if not self._is_mirroring:
             self._is_mirroring = True
             self.configure(fg_color=BG_CARD_ACTIVE, border_color=ACCENT)
-            self.on_click(self.device, self)
+        # Clicks on a live mirror still reach the app so it can bump its recency
+        self.on_click(self.device, self)
 
     def reset_state(self):
         self._is_mirroring = False
@@ -383,7 +689,7 @@ class StatusBadge(ctk.CTkFrame):
         super().__init__(master, fg_color="transparent")
         self.dot = ctk.CTkFrame(self, width=8, height=8, corner_radius=4, fg_color=color)
         self.dot.pack(side="left", padx=(0, 6))
-        self.label = ctk.CTkLabel(self, text=text, font=ctk.CTkFont(size=12), text_color=TEXT_SECONDARY)
+        self.label = ctk.CTkLabel(self, text=text, font=_font(12), text_color=TEXT_SECONDARY)
         self.label.pack(side="left")
 
     def update_status(self, text: str, color: str):
@@ -399,8 +705,14 @@ class AndroidMirrorApp(ctk.CTk):
         self.configure(fg_color=BG_DARK)
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
+        # Screen size doesn't change while running; cache it for dialog placement
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
         self.adb_path = _find_bundled_adb()
         self.scrcpy_path = _find_bundled_scrcpy()
+        self._zadig_path = _find_zadig()
+        if self.adb_path:
+            threading.Thread(target=_start_adb_server, args=(self.adb_path,), daemon=True).start()
 
         if self.adb_path and self.scrcpy_path:
             self.tool_env = _build_env(self.adb_path, self.scrcpy_path)
@@ -408,14 +720,59 @@ class AndroidMirrorApp(ctk.CTk):
             self.tool_env = os.environ.copy()
 
         self.current_devices: list[dict] = []
-        self.device_cards: list[DeviceCard] = []
-        self.active_mirrors: dict[str, subprocess.Popen] = {}
+        self.device_cards: dict[str, DeviceCard] = {}
+        # serial -> session dict, owned by the Tk thread. The entry is added on
+        # click, before scrcpy starts, so pending launches count toward the cap.
+        self.active_mirrors: OrderedDict[str, dict] = OrderedDict()
+        # All mirror sessions share one event loop thread
+        self._mirror_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._run_mirror_loop, daemon=True).start()
+        # The mirror loop never calls into Tk; it queues callbacks that the
+        # Tk thread drains while any session is alive
+        self._ui_events: queue.SimpleQueue = queue.SimpleQueue()
+        self._live_sessions = 0
+        self._drain_job = None
+        self._ui_lock = threading.Lock()
+        self._ui_pending = False
+        self._pending_install_result: tuple[str, str, bool | None] | None = None
+        self._install_popup = None
+        self._status_reset_job = None
         self._poll_job = None
+        self._poll_interval = POLL_INTERVAL_MS
+        self._last_serials: set[tuple[str, str]] | None = None
+        self._last_full_probe_ts = 0.0
+        # A single long-lived worker runs probes; the queue holds at most one
+        # pending request so bursts of refreshes coalesce
+        self._probe_q: queue.Queue = queue.Queue(maxsize=1)
+        self._force_probe = False
+        self._force_lock = threading.Lock()
+        threading.Thread(target=self._probe_loop, daemon=True).start()
         self._build_ui()
+        self.bind("<FocusIn>", self._on_focus_in, add="+")
         self._start_polling()
 
         threading.Thread(target=self._check_update_async, daemon=True).start()
 
+    @property
+    def tool_env(self) -> dict:
+        return self._tool_env
+
+    @tool_env.setter
+    def tool_env(self, env: dict):
+        # Launch kwargs are rebuilt only when the env changes, not per mirror
+        self._tool_env = env
+        self._popen_kwargs = {
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+            "env": env,
+            "creationflags": _creation_flags(),
+        }
+
+    def _centered_geometry(self, width: int, height: int) -> str:
+        x = (self._screen_w - width) // 2
+        y = (self._screen_h - height) // 2
+        return f"{width}x{height}+{x}+{y}"
+
     def _check_update_async(self):
         metadata = _check_for_update()
         if metadata:
@@ -429,10 +786,7 @@ class AndroidMirrorApp(ctk.CTk):
         header.pack(fill="x", padx=24, pady=(24, 0))
         title = ctk.CTkLabel(
             header, text="Android Mirror & APK Installer",
-            font=ctk.CTkFont(
-                family="Segoe UI" if SYSTEM == "Windows" else "SF Pro Display",
-                size=26, weight="bold"
-            ),
+            font=_font(26, "bold", UI_FONT_FAMILY),
             text_color=TEXT_PRIMARY,
         )
         title.pack(side="left")
@@ -441,17 +795,17 @@ class AndroidMirrorApp(ctk.CTk):
             header, text="⟳  Refresh", width=90, height=32,
             fg_color="transparent", hover_color=BG_CARD_HOVER,
             border_width=1, border_color=BORDER,
-            text_color=TEXT_SECONDARY, font=ctk.CTkFont(size=12),
-            command=self._refresh_devices,
+            text_color=TEXT_SECONDARY, font=_font(12),
+            command=self._manual_refresh,
         )
         refresh_btn.pack(side="right")
 
-        if SYSTEM == "Windows" and self._find_zadig():
+        if SYSTEM == "Windows" and self._zadig_path:
             zadig_btn = ctk.CTkButton(
                 header, text="🔧 USB Driver", width=110, height=32,
                 fg_color="transparent", hover_color=BG_CARD_HOVER,
                 border_width=1, border_color=BORDER,
-                text_color=TEXT_SECONDARY, font=ctk.CTkFont(size=12),
+                text_color=TEXT_SECONDARY, font=_font(12),
                 command=self._show_zadig_menu,
             )
             zadig_btn.pack(side="right", padx=(0, 8))
@@ -466,12 +820,12 @@ class AndroidMirrorApp(ctk.CTk):
         self.scrcpy_badge.pack(side="left", padx=(0, 16))
 
         self.device_count_label = ctk.CTkLabel(
-            status_frame, text="", font=ctk.CTkFont(size=12), text_color=TEXT_MUTED,
+            status_frame, text="", font=_font(12), text_color=TEXT_MUTED,
         )
         self.device_count_label.pack(side="right")
         version_label = ctk.CTkLabel(
             status_frame, text=f"v{VERSION}",
-            font=ctk.CTkFont(size=11), text_color=TEXT_MUTED,
+            font=_font(11), text_color=TEXT_MUTED,
         )
         version_label.pack(side="right", padx=(0, 16))
         self._update_tool_status()
@@ -492,9 +846,10 @@ class AndroidMirrorApp(ctk.CTk):
         
         self.apk_status_label = ctk.CTkLabel(
             self.apk_status_frame, text="",
-            font=ctk.CTkFont(size=12), text_color=TEXT_MUTED,
+            font=_font(12), text_color=TEXT_MUTED,
         )
         self.apk_status_label.pack(expand=True)
+        self._build_toast()
 
     def _build_empty_state(self):
         for w in self.empty_frame.winfo_children():
@@ -517,28 +872,28 @@ class AndroidMirrorApp(ctk.CTk):
 
         ctk.CTkLabel(
             self.empty_frame, text=icon,
-            font=ctk.CTkFont(size=48), text_color=TEXT_MUTED,
+            font=_font(48), text_color=TEXT_MUTED,
         ).pack(pady=(60, 12))
 
         ctk.CTkLabel(
             self.empty_frame, text=title,
-            font=ctk.CTkFont(size=18, weight="bold"), text_color=TEXT_SECONDARY,
+            font=_font(18, "bold"), text_color=TEXT_SECONDARY,
         ).pack(pady=(0, 8))
 
         ctk.CTkLabel(
             self.empty_frame, text=desc,
-            font=ctk.CTkFont(size=13), text_color=TEXT_MUTED,
+            font=_font(13), text_color=TEXT_MUTED,
             justify="center",
         ).pack()
 
         # Zadig, Za-Done
-        if show_zadig and self._find_zadig():
+        if show_zadig and self._zadig_path:
             zadig_frame = ctk.CTkFrame(self.empty_frame, fg_color="transparent")
             zadig_frame.pack(pady=(20, 0))
             
             ctk.CTkLabel(
                 zadig_frame, text="Device not detected? Try fixing the USB driver:",
-                font=ctk.CTkFont(size=11), text_color=TEXT_MUTED,
+                font=_font(11), text_color=TEXT_MUTED,
             ).pack(pady=(0, 8))
             
             btn_frame = ctk.CTkFrame(zadig_frame, fg_color="transparent")
@@ -547,7 +902,7 @@ class AndroidMirrorApp(ctk.CTk):
             ctk.CTkButton(
                 btn_frame, text="⚡ Install USB Driver",
                 fg_color=BLUE, hover_color="#3D8AD9",
-                text_color=TEXT_PRIMARY, font=ctk.CTkFont(size=12, weight="bold"),
+                text_color=TEXT_PRIMARY, font=_font(12, "bold"),
                 width=140, height=32,
                 command=lambda: self._launch_zadig(install=True),
             ).pack(side="left", padx=(0, 8))
@@ -557,7 +912,7 @@ class AndroidMirrorApp(ctk.CTk):
                     btn_frame, text="↩ Restore Default Driver",
                     fg_color="transparent", hover_color=BG_CARD_HOVER,
                     border_width=1, border_color=BORDER,
-                    text_color=TEXT_SECONDARY, font=ctk.CTkFont(size=12),
+                    text_color=TEXT_SECONDARY, font=_font(12),
                     width=160, height=32,
                     command=lambda: self._launch_zadig(install=False),
                 ).pack(side="left")
@@ -582,17 +937,6 @@ class AndroidMirrorApp(ctk.CTk):
             "See README.md for setup instructions."
         )
 
-    def _find_zadig(self) -> str | None:
-        if SYSTEM != "Windows":
-            return None
-        path = os.path.join(TOOLS_DIR, "windows", "zadig-2.9.exe")
-        if os.path.isfile(path):
-            return path
-        path = os.path.join(TOOLS_DIR, "windows", "zadig.exe")
-        if os.path.isfile(path):
-            return path
-        return None
-
     def _is_windows_11(self) -> bool:
         if SYSTEM != "Windows":
             return False
@@ -600,31 +944,26 @@ class AndroidMirrorApp(ctk.CTk):
             version = platform.version()
             build = int(version.split('.')[2]) if len(version.split('.')) > 2 else 0
             return build >= 22000
-        except:
+        except ValueError:
             return False
 
     def _launch_zadig(self, install: bool = True):
-        zadig_path = self._find_zadig()
+        zadig_path = self._zadig_path
         if not zadig_path:
             self._show_toast("Zadig not found in tools/windows/", RED)
             return
 
         dialog = ctk.CTkToplevel(self)
         dialog.title("USB Driver Setup")
-        dialog.geometry("450x280")
+        dialog.geometry(self._centered_geometry(450, 280))
         dialog.resizable(False, False)
         dialog.configure(fg_color=BG_DARK)
         dialog.transient(self)
         dialog.grab_set()
-
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 450) // 2
-        y = (dialog.winfo_screenheight() - 280) // 2
-        dialog.geometry(f"450x280+{x}+{y}")
         
         ctk.CTkLabel(
             dialog, text="🔧",
-            font=ctk.CTkFont(size=36),
+            font=_font(36),
         ).pack(pady=(20, 10))
 
         if install:
@@ -651,13 +990,13 @@ class AndroidMirrorApp(ctk.CTk):
 
         ctk.CTkLabel(
             dialog, text=title,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             text_color=TEXT_PRIMARY,
         ).pack(pady=(0, 10))
         
         ctk.CTkLabel(
             dialog, text=instructions,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=TEXT_SECONDARY,
             justify="left",
         ).pack(padx=30, pady=(0, 15))
@@ -679,7 +1018,7 @@ class AndroidMirrorApp(ctk.CTk):
         ctk.CTkButton(
             dialog, text="Open Zadig",
             fg_color=BLUE, hover_color="#3D8AD9",
-            text_color=TEXT_PRIMARY, font=ctk.CTkFont(size=13, weight="bold"),
+            text_color=TEXT_PRIMARY, font=_font(13, "bold"),
             width=120, height=36,
             command=open_zadig,
         ).pack()
@@ -687,34 +1026,29 @@ class AndroidMirrorApp(ctk.CTk):
     def _show_zadig_menu(self):
         dialog = ctk.CTkToplevel(self)
         dialog.title("USB Driver Options")
-        dialog.geometry("320x200")
+        dialog.geometry(self._centered_geometry(320, 200))
         dialog.resizable(False, False)
         dialog.configure(fg_color=BG_DARK)
         dialog.transient(self)
         dialog.grab_set()
-
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 320) // 2
-        y = (dialog.winfo_screenheight() - 200) // 2
-        dialog.geometry(f"320x200+{x}+{y}")
         
         ctk.CTkLabel(
             dialog, text="🔧 USB Driver Options",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             text_color=TEXT_PRIMARY,
         ).pack(pady=(20, 5))
         
         win11_text = " (Windows 11)" if self._is_windows_11() else ""
         ctk.CTkLabel(
             dialog, text=f"Choose an action{win11_text}:",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=TEXT_SECONDARY,
         ).pack(pady=(0, 15))
 
         ctk.CTkButton(
             dialog, text="⚡ Install WinUSB Driver",
             fg_color=BLUE, hover_color="#3D8AD9",
-            text_color=TEXT_PRIMARY, font=ctk.CTkFont(size=13, weight="bold"),
+            text_color=TEXT_PRIMARY, font=_font(13, "bold"),
             width=220, height=36,
             command=lambda: [dialog.destroy(), self._launch_zadig(install=True)],
         ).pack(pady=(0, 8))
@@ -725,7 +1059,7 @@ class AndroidMirrorApp(ctk.CTk):
             dialog, text="↩ Restore Default Driver",
             fg_color=restore_color, hover_color="#E5C235" if self._is_windows_11() else BG_CARD_HOVER,
             border_width=0 if self._is_windows_11() else 1, border_color=BORDER,
-            text_color=restore_text_color, font=ctk.CTkFont(size=13),
+            text_color=restore_text_color, font=_font(13),
             width=220, height=36,
             command=lambda: [dialog.destroy(), self._launch_zadig(install=False)],
         ).pack(pady=(0, 8))
@@ -734,7 +1068,7 @@ class AndroidMirrorApp(ctk.CTk):
             dialog, text="Cancel",
             fg_color="transparent", hover_color=BG_CARD_HOVER,
             border_width=1, border_color=BORDER,
-            text_color=TEXT_MUTED, font=ctk.CTkFont(size=12),
+            text_color=TEXT_MUTED, font=_font(12),
             width=100, height=28,
             command=dialog.destroy,
         ).pack()
@@ -750,53 +1084,152 @@ class AndroidMirrorApp(ctk.CTk):
         else:
             self.scrcpy_badge.update_status("scrcpy ✗", RED)
 
-    def _start_polling(self):
-        self._refresh_devices()
-        self._poll_job = self.after(POLL_INTERVAL_MS, self._start_polling)
+    def _start_polling(self, force: bool = False):
+        self._refresh_devices(force)
+        # Nothing attached and nobody looking: back off until focus returns
+        if self.current_devices or self._has_focus():
+            self._poll_interval = POLL_INTERVAL_MS
+        else:
+            self._poll_interval = min(self._poll_interval * 2, MAX_POLL_INTERVAL_MS)
+        self._poll_job = self.after(self._poll_interval, self._start_polling)
 
-    def _refresh_devices(self):
-        if not self.adb_path:
-            self.adb_path = _find_bundled_adb()
-        if not self.scrcpy_path:
-            self.scrcpy_path = _find_bundled_scrcpy()
-        if self.adb_path and self.scrcpy_path:
-            self.tool_env = _build_env(self.adb_path, self.scrcpy_path)
-        self._update_tool_status()
+    def _has_focus(self) -> bool:
+        try:
+            return self.focus_get() is not None
+        except KeyError:
+            # focus_get can't map some internal Tk widgets, but one has focus
+            return True
+
+    def _on_focus_in(self, event):
+        if self._poll_interval > POLL_INTERVAL_MS:
+            self._poll_interval = POLL_INTERVAL_MS
+            if self._poll_job:
+                self.after_cancel(self._poll_job)
+            self._start_polling()
+
+    def _manual_refresh(self):
+        # Restart the poll timer so the scheduled poll doesn't fire right after
+        if self._poll_job:
+            self.after_cancel(self._poll_job)
+        self._start_polling(force=True)
+
+    def _refresh_devices(self, force: bool = False):
+        # Only look for tools (and rebuild their env) while one is missing
+        if not (self.adb_path and self.scrcpy_path):
+            _scan_tools()
+            if not self.adb_path:
+                self.adb_path = _find_bundled_adb()
+            if not self.scrcpy_path:
+                self.scrcpy_path = _find_bundled_scrcpy()
+            if self.adb_path and self.scrcpy_path:
+                self.tool_env = _build_env(self.adb_path, self.scrcpy_path)
+            self._update_tool_status()
 
         if not self.adb_path:
             self._show_empty()
             return
-        threading.Thread(target=self._fetch_and_update, daemon=True).start()
+        if force:
+            with self._force_lock:
+                self._force_probe = True
+        try:
+            self._probe_q.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def _run_mirror_loop(self):
+        _lower_thread_priority()
+        self._mirror_loop.run_forever()
+
+    def _probe_loop(self):
+        _lower_thread_priority()
+        while True:
+            self._probe_q.get()
+            with self._force_lock:
+                force, self._force_probe = self._force_probe, False
+            try:
+                self._probe_devices(force)
+            except Exception as e:
+                print(f"[Probe Error] {type(e).__name__}: {e}")
+
+    def _probe_devices(self, force: bool):
+        serials = get_adb_serials(self.adb_path)
+        if (
+            not force
+            and serials is not None
+            and serials == self._last_serials
+            and time.monotonic() - self._last_full_probe_ts < FULL_PROBE_INTERVAL_S
+        ):
+            return
 
-    def _fetch_and_update(self):
         devices = get_adb_devices(self.adb_path)
+        self._last_serials = serials
+        self._last_full_probe_ts = time.monotonic()
         self.after(0, lambda: self._update_device_list(devices))
 
     def _update_device_list(self, devices: list[dict]):
-        current_serials = {d["serial"] for d in self.current_devices}
         new_serials = {d["serial"] for d in devices}
 
-        if current_serials == new_serials and len(devices) == len(self.current_devices):
-            self._update_count(len(devices))
+        if devices and new_serials == set(self.device_cards) and all(
+            self.device_cards[d["serial"]].device["status"] == d["status"] for d in devices
+        ):
+            self.current_devices = devices
+            for device in devices:
+                self.device_cards[device["serial"]].update_device(device)
             return
 
+        for cache in (_PROP_CACHE, _PROBE_FAILURES):
+            for serial in list(cache):
+                if serial not in new_serials:
+                    del cache[serial]
+        for serial in list(_ADB_SHELLS):
+            if serial not in new_serials:
+                _close_adb_shell(serial)
+
         self.current_devices = devices
         self._update_count(len(devices))
 
-        for card in self.device_cards:
-            card.destroy()
-        self.device_cards.clear()
+        for serial in list(self.device_cards):
+            if serial not in new_serials:
+                self.device_cards.pop(serial).destroy()
 
         if not devices:
-            self._show_empty()
+            if not self.empty_frame.winfo_manager():
+                self._show_empty()
             return
 
         self.empty_frame.pack_forget()
 
+        # Patch cards in place and only create/destroy the ones that changed
         for device in devices:
-            card = DeviceCard(self.scroll_frame, device, self._on_device_click)
-            card.pack(fill="x", pady=(0, 8))
-            self.device_cards.append(card)
+            serial = device["serial"]
+            card = self.device_cards.get(serial)
+            if card is not None and card.device["status"] == device["status"]:
+                card.update_device(device)
+                continue
+            if card is not None:
+                card.destroy()
+            self.device_cards[serial] = DeviceCard(self.scroll_frame, device, self._on_device_click)
+        # Pack all new cards in one idle pass so Tk lays them out once
+        self.after_idle(self._pack_cards)
+
+    def _pack_cards(self):
+        # Insert unpacked cards next to their packed neighbour so the on-screen
+        # order keeps following current_devices
+        prev = None
+        for device in self.current_devices:
+            card = self.device_cards.get(device["serial"])
+            if card is None or not card.winfo_exists():
+                continue
+            if not card.winfo_manager():
+                if prev is not None:
+                    card.pack(fill="x", pady=(0, 8), after=prev)
+                else:
+                    packed = self.scroll_frame.pack_slaves()
+                    if packed:
+                        card.pack(fill="x", pady=(0, 8), before=packed[0])
+                    else:
+                        card.pack(fill="x", pady=(0, 8))
+            prev = card
 
     def _update_count(self, count: int):
         if count == 0:
@@ -807,7 +1240,7 @@ class AndroidMirrorApp(ctk.CTk):
             self.device_count_label.configure(text=f"{count} devices", text_color=ACCENT)
 
     def _show_empty(self):
-        for card in self.device_cards:
+        for card in self.device_cards.values():
             card.destroy()
         self.device_cards.clear()
         self._build_empty_state()
@@ -820,85 +1253,166 @@ class AndroidMirrorApp(ctk.CTk):
             card.reset_state()
             return
 
+        model = device.get("model", serial)
         if serial in self.active_mirrors:
-            proc = self.active_mirrors[serial]
-            if proc.poll() is None:
-                self._show_toast(f"Already mirroring {device.get('model', serial)}", YELLOW)
-                card.reset_state()
+            proc = self.active_mirrors[serial]["proc"]
+            if proc is None or proc.returncode is None:
+                self.active_mirrors.move_to_end(serial)
+                self._show_toast(f"Already mirroring {model}", YELLOW)
                 return
             else:
                 del self.active_mirrors[serial]
 
-        self._show_toast(f"Launching mirror for {device.get('model', serial)}…", ACCENT)
-
-        def launch():
+        message = f"Launching mirror for {model}…"
+        if len(self.active_mirrors) >= MAX_MIRRORS:
+            # Bound live scrcpy processes by closing the least recently used one
+            _, old_session = self.active_mirrors.popitem(last=False)
+            self._stop_mirror(old_session)
+            message += f" (closed mirror for {old_session['model']})"
+        session = {"model": model, "proc": None, "stopped": False}
+        self.active_mirrors[serial] = session
+        self._show_toast(message, ACCENT)
+        self._live_sessions += 1
+        if self._drain_job is None:
+            self._drain_job = self.after(UI_DRAIN_INTERVAL_MS, self._drain_ui_events)
+        asyncio.run_coroutine_threadsafe(self._launch_mirror_async(device, session), self._mirror_loop)
+
+    def _stop_mirror(self, session: dict):
+        # If scrcpy hasn't started yet the launch sees the flag and stops it
+        session["stopped"] = True
+        proc = session["proc"]
+        if proc is not None:
+            asyncio.run_coroutine_threadsafe(_terminate_all([proc]), self._mirror_loop)
+
+    def _drain_ui_events(self):
+        while True:
             try:
-                cmd = [
-                    self.scrcpy_path,
-                    "-s", serial,
-                    "--window-title", f"Mirror: {device.get('model', serial)}",
-                ]
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    env=self.tool_env,
-                    creationflags=_creation_flags(),
-                )
-                self.active_mirrors[serial] = proc
-                
-                def monitor_output(stream):
-                    try:
-                        for line in iter(stream.readline, b''):
-                            line = line.decode('utf-8', errors='replace').strip()
-                            if not line:
-                                continue
-                            print(f"[scrcpy] {line}")  # Debug output
-                            line_lower = line.lower()
-                            if "installing" in line_lower or "install " in line_lower:
-                                self.after(0, lambda: self._update_apk_status("Installing...", YELLOW))
-                            elif "success" in line_lower:
-                                self.after(0, lambda: self._update_apk_status("Success!", ACCENT))
-                                self.after(0, lambda: self._show_install_popup(True))
-                                self.after(3000, lambda: self._update_apk_status("", TEXT_MUTED))
-                            elif "failure" in line_lower or "failed" in line_lower or "error" in line_lower:
-                                self.after(0, lambda: self._update_apk_status("Failed!", RED))
-                                self.after(0, lambda: self._show_install_popup(False))
-                                self.after(3000, lambda: self._update_apk_status("", TEXT_MUTED))
-                    except:
-                        pass
-
-                stdout_thread = threading.Thread(target=monitor_output, args=(proc.stdout,), daemon=True)
-                stderr_thread = threading.Thread(target=monitor_output, args=(proc.stderr,), daemon=True)
-                stdout_thread.start()
-                stderr_thread.start()
-
-                proc.wait()
-            except Exception as e:
-                self.after(0, lambda: self._show_toast(f"Error: {e}", RED))
-            finally:
-                self.active_mirrors.pop(serial, None)
-                self.after(0, card.reset_state)
+                callback = self._ui_events.get_nowait()
+            except queue.Empty:
+                break
+            callback()
+        if self._live_sessions:
+            self._drain_job = self.after(UI_DRAIN_INTERVAL_MS, self._drain_ui_events)
+        else:
+            self._drain_job = None
+
+    def _on_mirror_ended(self, serial: str, session: dict):
+        self._live_sessions -= 1
+        if self.active_mirrors.get(serial) is session:
+            del self.active_mirrors[serial]
+        card = self.device_cards.get(serial)
+        if card is not None and serial not in self.active_mirrors:
+            card.reset_state()
 
-        threading.Thread(target=launch, daemon=True).start()
+    async def _launch_mirror_async(self, device: dict, session: dict):
+        # Runs on the shared mirror loop thread, one task per mirror session
+        serial = device["serial"]
+        try:
+            cmd = [
+                self.scrcpy_path,
+                "-s", serial,
+                "--window-title", f"Mirror: {device.get('model', serial)}",
+            ]
+            if SYSTEM == "Linux" and shutil.which("stdbuf"):
+                # Have scrcpy flush per line so log bursts arrive smoothly
+                cmd = ["stdbuf", "-oL", "-eL"] + cmd
+            proc = await asyncio.create_subprocess_exec(*cmd, **self._popen_kwargs)
+            session["proc"] = proc
+            if session["stopped"]:
+                # Evicted while it was still starting
+                await _terminate_all([proc])
+
+            # After a success, lines are only checked for the start of the
+            # next install (scrcpy can install several APKs per session)
+            terminal = False
+
+            def handle_line(raw: bytes):
+                nonlocal terminal
+                raw = raw.strip()
+                lowered = raw.lower()
+                if terminal and b"installing" not in lowered:
+                    return
+                if not raw:
+                    return
+                if SCRCPY_DEBUG:
+                    sys.stdout.buffer.write(b"[scrcpy] " + raw + b"\n")
+                    sys.stdout.buffer.flush()
+                # Most lines carry no marker; plain substring checks reject them
+                # much faster than running the regex
+                if not (
+                    b"install" in lowered or b"success" in lowered
+                    or b"fail" in lowered or b"error" in lowered
+                ):
+                    return
+                found = {m.lastgroup for m in _RE_INSTALL_LOG.finditer(lowered)}
+                if "inst" in found:
+                    terminal = False
+                    self._post_install_result("Installing...", YELLOW)
+                elif "ok" in found:
+                    terminal = True
+                    self._post_install_result("Success!", ACCENT, popup=True)
+                elif "bad" in found:
+                    self._post_install_result("Failed!", RED, popup=False)
+
+            # stderr is merged into stdout, read whatever is available in large
+            # chunks and split lines ourselves
+            buf = b""
+            # An empty read means scrcpy closed the pipe
+            try:
+                while chunk := await proc.stdout.read(PIPE_READ_SIZE):
+                    lines = (buf + chunk).split(b"\n")
+                    buf = lines.pop()
+                    for raw in lines:
+                        handle_line(raw)
+                if buf:
+                    handle_line(buf)
+            except (OSError, ValueError):
+                pass
+            await proc.wait()
+        except Exception as e:
+            message = f"Error: {e}"
+            self._ui_events.put(lambda: self._show_toast(message, RED))
+        finally:
+            self._ui_events.put(lambda: self._on_mirror_ended(serial, session))
+
+    def _post_install_result(self, status: str, color: str, popup: bool | None = None):
+        # Called from the mirror loop. Only the latest result is kept and at
+        # most one UI callback is queued until the main thread drains it.
+        with self._ui_lock:
+            self._pending_install_result = (status, color, popup)
+            if self._ui_pending:
+                return
+            self._ui_pending = True
+        self._ui_events.put(self._apply_install_result)
+
+    def _apply_install_result(self):
+        with self._ui_lock:
+            result, self._pending_install_result = self._pending_install_result, None
+            self._ui_pending = False
+        if result is None:
+            return
+        status, color, popup = result
+        self._update_apk_status(status, color)
+        # Keep at most one reset timer; a newer status supersedes the old one
+        if self._status_reset_job:
+            self.after_cancel(self._status_reset_job)
+            self._status_reset_job = None
+        if popup is not None:
+            self._show_install_popup(popup)
+            self._status_reset_job = self.after(3000, self._clear_status)
+
+    def _clear_status(self):
+        self._status_reset_job = None
+        self._update_apk_status("", TEXT_MUTED)
 
     def _update_apk_status(self, message: str, color: str):
         self.apk_status_label.configure(text=message, text_color=color)
 
     def _show_install_popup(self, success: bool):
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("Installation Completed")
-        dialog.geometry("280x120")
-        dialog.resizable(False, False)
-        dialog.configure(fg_color=BG_DARK)
-        dialog.transient(self)
-        dialog.grab_set()
+        # Built once, then re-themed and re-shown for every result
+        if self._install_popup is None:
+            self._build_install_popup()
 
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 280) // 2
-        y = (dialog.winfo_screenheight() - 120) // 2
-        dialog.geometry(f"280x120+{x}+{y}")
-        
         if success:
             icon = "✓"
             message = "Success!"
@@ -908,44 +1422,80 @@ class AndroidMirrorApp(ctk.CTk):
             message = "Failed!"
             color = RED
 
+        self._popup_icon.configure(text=icon, text_color=color)
+        self._popup_message.configure(text=message, text_color=color)
+        self._popup_button.configure(
+            fg_color=color, hover_color=ACCENT_DIM if success else "#CC5555",
+            text_color=BG_DARK if success else TEXT_PRIMARY,
+        )
+        self._install_popup.deiconify()
+        self._install_popup.lift()
+        self._install_popup.grab_set()
+
+    def _build_install_popup(self):
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Installation Completed")
+        dialog.geometry(self._centered_geometry(280, 120))
+        dialog.resizable(False, False)
+        dialog.configure(fg_color=BG_DARK)
+        dialog.transient(self)
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_install_popup)
+
         msg_frame = ctk.CTkFrame(dialog, fg_color="transparent")
         msg_frame.pack(pady=(25, 15))
-        
-        ctk.CTkLabel(
-            msg_frame, text=icon,
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=color,
-        ).pack(side="left", padx=(0, 8))
-        
-        ctk.CTkLabel(
-            msg_frame, text=message,
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=color,
-        ).pack(side="left")
 
-        ctk.CTkButton(
+        self._popup_icon = ctk.CTkLabel(msg_frame, text="", font=_font(24, "bold"))
+        self._popup_icon.pack(side="left", padx=(0, 8))
+
+        self._popup_message = ctk.CTkLabel(msg_frame, text="", font=_font(18, "bold"))
+        self._popup_message.pack(side="left")
+
+        self._popup_button = ctk.CTkButton(
             dialog, text="OK",
-            fg_color=color, hover_color=ACCENT_DIM if success else "#CC5555",
-            text_color=BG_DARK if success else TEXT_PRIMARY,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=_font(13, "bold"),
             width=100, height=32,
-            command=dialog.destroy,
-        ).pack()
+            command=self._hide_install_popup,
+        )
+        self._popup_button.pack()
+        self._install_popup = dialog
+
+    def _hide_install_popup(self):
+        self._install_popup.grab_release()
+        self._install_popup.withdraw()
+
+    def _build_toast(self):
+        self._toast_frame = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=8, border_width=1)
+        self._toast_label = ctk.CTkLabel(self._toast_frame, text="", font=_font(13))
+        self._toast_label.pack(padx=16, pady=8)
+        self._toast_job = None
 
     def _show_toast(self, message: str, color: str = TEXT_SECONDARY):
-        toast = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=8, border_width=1, border_color=color)
-        toast.place(relx=0.5, rely=0.95, anchor="center")
-        ctk.CTkLabel(
-            toast, text=message, font=ctk.CTkFont(size=13), text_color=color,
-        ).pack(padx=16, pady=8)
-        self.after(3000, toast.destroy)
+        self._toast_label.configure(text=message, text_color=color)
+        self._toast_frame.configure(border_color=color)
+        self._toast_frame.place(relx=0.5, rely=0.95, anchor="center")
+        self._toast_frame.lift()
+        # The frame is shared, so an older timer must not hide the new message
+        if self._toast_job:
+            self.after_cancel(self._toast_job)
+        self._toast_job = self.after(3000, self._toast_frame.place_forget)
 
     def destroy(self):
         if self._poll_job:
             self.after_cancel(self._poll_job)
-        for serial, proc in self.active_mirrors.items():
-            if proc.poll() is None:
-                proc.terminate()
+        if self._drain_job:
+            self.after_cancel(self._drain_job)
+        procs = []
+        for session in self.active_mirrors.values():
+            session["stopped"] = True
+            if session["proc"] is not None:
+                procs.append(session["proc"])
+        self.active_mirrors.clear()
+        if procs:
+            future = asyncio.run_coroutine_threadsafe(_terminate_all(procs), self._mirror_loop)
+            try:
+                future.result(timeout=MIRROR_STOP_TIMEOUT_S + 0.5)
+            except FutureTimeoutError:
+                pass
         super().destroy()
 
 if __name__ == "__main__":